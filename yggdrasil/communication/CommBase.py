@@ -388,6 +388,10 @@ class CommBase(tools.YggClass):
             open. Defaults to False.
         single_use (bool, optional): If True, the comm will only be used to
             send/recv a single message. Defaults to False.
+        send_serializer (bool, optional): If True, the serializer will be sent
+            in the header of the next message. Defaults to None and is set to
+            False for single use comms that are not response servers and True
+            otherwise.
         reverse_names (bool, optional): If True, the suffix added to the comm
             with be reversed. Defaults to False.
         no_suffix (bool, optional): If True, no directional suffix will be added
@@ -560,7 +564,8 @@ class CommBase(tools.YggClass):
                  is_interface=None, language=None,
                  partner_model=None, partner_language='python',
                  recv_timeout=0.0, close_on_eof_recv=True, close_on_eof_send=False,
-                 single_use=False, reverse_names=False, no_suffix=False,
+                 single_use=False, send_serializer=None,
+                 reverse_names=False, no_suffix=False,
                  allow_multiple_comms=False,
                  is_client=False, is_response_client=False,
                  is_server=False, is_response_server=False,
@@ -643,9 +648,10 @@ class CommBase(tools.YggClass):
         self._timeout_drain = False
         self._server_class = CommServer
         self._server_kwargs = {}
-        self._send_serializer = True
-        if self.single_use and (not self.is_response_server):
-            self._send_serializer = False
+        if send_serializer is None:
+            send_serializer = not (self.single_use
+                                   and (not self.is_response_server))
+        self._send_serializer = send_serializer
         # Add interface tag
         if self.is_interface:
             self._name += '_I'
@@ -16,7 +16,10 @@ class DefaultComm(CommBase):
     def _reset_alias(cls):
         r"""Reset the alias so that it is recomputed the next time an instance
         is created."""
+        from yggdrasil.communication import _import_comm
         cls._alias = None
+        # Cached imports may resolve to the previous default comm
+        _import_comm.cache_clear()
 
     @classmethod
     def _get_alias(cls, overwrite=False):
@@ -30,7 +33,9 @@ class DefaultComm(CommBase):
             class: The actual default comm class that this class represents.
 
         """
-        if (getattr(cls, '_alias', None) is None) or overwrite:
+        if overwrite:
+            cls._reset_alias()
+        if getattr(cls, '_alias', None) is None:
             from yggdrasil.tools import get_default_comm
             cls._alias = import_component('comm', get_default_comm())
         return cls._alias
@@ -38,6 +38,10 @@ class FileComm(CommBase.CommBase):
         wait_for_creation (float, optional): Time (in seconds) that should be
             waited before opening for the file to be created if it dosn't exist.
             Defaults to 0 s and file will attempt to be opened immediately.
+        flush_every (int, optional): Number of messages that should be written
+            between flushes of the file. Files opened in append mode are
+            flushed after every message so that they can be read while being
+            written. Defaults to 1.
         **kwargs: Additional keywords arguments are passed to parent class.
 
     Attributes:
@@ -51,6 +55,7 @@ class FileComm(CommBase.CommBase):
             reached. If writing, each output will be to a new file in the series.
         platform_newline (str): String indicating a newline on the current
             platform.
+        flush_every (int): Number of messages written between flushes.
 
     Raises:
         ValueError: If the read_meth is not one of the supported values.
@@ -75,6 +80,7 @@ class FileComm(CommBase.CommBase):
         'in_temp': {'type': 'boolean', 'default': False},
         'is_series': {'type': 'boolean', 'default': False},
         'wait_for_creation': {'type': 'float', 'default': 0.0},
+        'flush_every': {'type': 'integer', 'default': 1, 'minimum': 1},
         'serializer': {'oneOf': [{'$ref': '#/definitions/serializer'},
                                  {'type': 'instance',
                                   'class': SerializeBase}],
@@ -104,6 +110,7 @@ class FileComm(CommBase.CommBase):
         # Process file class keywords
         if not hasattr(self, '_fd'):
             self._fd = None
+        self._unflushed_sends = 0
         self.platform_newline = platform._newline
         if self.in_temp:
             self.address = os.path.join(tempfile.gettempdir(), self.address)
@@ -340,6 +347,7 @@ class FileComm(CommBase.CommBase):
         r"""Flush the file."""
         with self._closing_thread.lock:
             self.fd.flush()
+            self._unflushed_sends = 0
 
     def record_position(self):
         r"""Record the current position in the file/series."""
@@ -622,6 +630,7 @@ class FileComm(CommBase.CommBase):
         with self._closing_thread.lock:
             if (not self.concats_as_str) and self.is_open and (self.file_tell() != 0):
                 new_obj = obj
+                self.file_flush()
                 with open(self.current_address, 'rb') as fd:
                     old_obj = self.deserialize(fd.read())[0]
                 obj = self.serializer.concatenate([old_obj, new_obj])
@@ -651,9 +660,13 @@ class FileComm(CommBase.CommBase):
             self.write_header()
         # Write message
         try:
-            if not self.is_eof(msg):
+            if self.is_eof(msg):
+                self.file_flush()
+            else:
                 self._file_send(msg)
-            self.file_flush()
+                self._unflushed_sends += 1
+                if self.append or (self._unflushed_sends >= self.flush_every):
+                    self.file_flush()
         except (AttributeError, ValueError):  # pragma: debug
             if self.is_open:
                 raise
@@ -704,7 +717,10 @@ class FileComm(CommBase.CommBase):
             else:
                 out = self.eof_msg
         else:
-            if isinstance(out, bytes):
+            # Skip the replace (and the copy of the message that it makes)
+            # when the platform already uses the serializer's newline
+            if ((isinstance(out, bytes)
+                 and (self.platform_newline != self.serializer.newline))):
                 out = out.replace(self.platform_newline, self.serializer.newline)
             if flag and (not self.is_eof(out)):
                 if (((self.read_meth == 'readline')
@@ -1,5 +1,23 @@
+import functools
 from contextlib import contextmanager
 from yggdrasil.components import import_component
+_commtype_alias = {'server': 'ServerComm',
+                   'client': 'ClientComm',
+                   'fork': 'ForkComm'}
+_suffix_table = {
+    # (no_suffix, reverse_names, direction): suffix
+    (True, False, 'send'): '', (True, False, 'recv'): '',
+    (True, True, 'send'): '', (True, True, 'recv'): '',
+    (False, False, 'send'): '_OUT', (False, False, 'recv'): '_IN',
+    (False, True, 'send'): '_IN', (False, True, 'recv'): '_OUT'}
+_file_mode_table = {
+    # mode: keyword arguments for the file comm
+    'r': {'direction': 'recv'},
+    'w': {'direction': 'send'},
+    'a': {'direction': 'send', 'append': True}}
+_async_comm_class = None
+_error_commtypes = frozenset(['ErrorComm', 'error'])
+_no_async_wrap_commtypes = frozenset([None, 'client', 'server', 'fork'])
 
 
 class TemporaryCommunicationError(Exception):
@@ -28,11 +46,39 @@ def import_comm(commtype=None):
         CommBase: Associated communication class.
 
     """
-    if commtype in ['server', 'client', 'fork']:
-        commtype = '%sComm' % commtype.title()
+    return _import_comm(_commtype_alias.get(commtype, commtype))
+
+
+@functools.lru_cache(maxsize=None)
+def _import_comm(commtype):
+    r"""Cached import of a comm class from its component subtype.
+
+    Args:
+        commtype (str): Communication class subtype with aliases resolved.
+
+    Returns:
+        CommBase: Associated communication class.
+
+    """
     return import_component('comm', commtype)
 
 
+def _get_async_comm():
+    r"""Get the AsyncComm class, importing it the first time it is needed.
+    AsyncComm cannot be imported when this module is loaded as it depends on
+    CommBase.
+
+    Returns:
+        class: AsyncComm class.
+
+    """
+    global _async_comm_class
+    if _async_comm_class is None:
+        from yggdrasil.communication.AsyncComm import AsyncComm
+        _async_comm_class = AsyncComm
+    return _async_comm_class
+
+
 def determine_suffix(no_suffix=False, reverse_names=False,
                      direction='send', **kwargs):
     r"""Determine the suffix that should be used for the comm name.
@@ -55,17 +101,10 @@ def determine_suffix(no_suffix=False, reverse_names=False,
         ValueError: If the direction is not 'recv' or 'send'.
 
     """
-    if direction not in ['send', 'recv']:
+    try:
+        return _suffix_table[(bool(no_suffix), bool(reverse_names), direction)]
+    except KeyError:
         raise ValueError("Unrecognized message direction: %s" % direction)
-    if no_suffix:
-        suffix = ''
-    else:
-        if ((((direction == 'send') and (not reverse_names))
-             or ((direction == 'recv') and reverse_names))):
-            suffix = '_OUT'
-        else:
-            suffix = '_IN'
-    return suffix
 
 
 def new_comm(name, commtype=None, use_async=False, **kwargs):
@@ -98,7 +137,7 @@ def new_comm(name, commtype=None, use_async=False, **kwargs):
             commtype = 'fork'
     if (commtype is None) and kwargs.get('filetype', None):
         commtype = kwargs.pop('filetype')
-    if commtype in ['ErrorComm', 'error']:
+    if commtype in _error_commtypes:
         kwargs['commtype'] = commtype
         commtype = kwargs['base_commtype']
     comm_cls = import_comm(commtype)
@@ -106,15 +145,12 @@ def new_comm(name, commtype=None, use_async=False, **kwargs):
         use_async = False
     async_kws = {}
     if use_async:
-        from yggdrasil.communication.AsyncComm import AsyncComm
+        AsyncComm = _get_async_comm()
         async_kws = {k: kwargs.pop(k) for k in AsyncComm._async_kws
                      if k in kwargs}
-    if use_async:
         kwargs['is_async'] = True
     out = comm_cls.new_comm(name, **kwargs)
-    if use_async and (out._commtype not in [None, 'client',
-                                            'server', 'fork']):
-        from yggdrasil.communication.AsyncComm import AsyncComm
+    if use_async and (out._commtype not in _no_async_wrap_commtypes):
         out = AsyncComm(out, **async_kws)
     return out
 
@@ -166,15 +202,11 @@ def open_file_comm(fname, mode, filetype='binary', **kwargs):
     """
     comm = None
     try:
-        comm_cls = import_component('file', filetype)
-        if mode == 'r':
-            kwargs['direction'] = 'recv'
-        elif mode in ['w', 'a']:
-            kwargs['direction'] = 'send'
-            if mode == 'a':
-                kwargs['append'] = True
-        else:
+        try:
+            kwargs.update(_file_mode_table[mode])
+        except KeyError:
             raise ValueError("Unsupported mode: '%s'" % mode)
+        comm_cls = import_component('file', filetype)
         comm = comm_cls('file', address=fname, **kwargs)
         yield comm
     finally:
@@ -3,7 +3,8 @@ import uuid
 from yggdrasil.tests import (
     generate_component_tests, generate_component_subtests,
     assert_equal, assert_raises)
-from yggdrasil.communication import open_file_comm
+from yggdrasil.communication import (
+    open_file_comm, import_comm, determine_suffix, _import_comm)
 from yggdrasil.communication.tests.test_FileComm import TestFileComm
 
 
@@ -15,6 +16,51 @@ generate_component_subtests('comm', 'Async', globals(),
                             skip_subtypes=['default'])
 
 
+def test_import_comm():
+    r"""Test import_comm aliases and caching."""
+    from yggdrasil.communication.ServerComm import ServerComm
+    assert(import_comm('server') is ServerComm)
+    assert(import_comm('ServerComm') is ServerComm)
+    _import_comm.cache_clear()
+    assert(import_comm() is import_comm())
+    assert_equal(_import_comm.cache_info().misses, 1)
+    assert_equal(_import_comm.cache_info().hits, 1)
+    # Aliases are resolved before the cache is checked
+    import_comm('server')
+    import_comm('ServerComm')
+    assert_equal(_import_comm.cache_info().hits, 2)
+
+
+def test_import_comm_default():
+    r"""Test that import_comm follows changes to the default comm."""
+    from yggdrasil.components import import_component
+    from yggdrasil.communication.DefaultComm import DefaultComm
+    old_default = os.environ.get('YGG_DEFAULT_COMM', None)
+    try:
+        for x in ['zmq', 'ipc', 'zmq']:
+            os.environ['YGG_DEFAULT_COMM'] = x
+            DefaultComm._reset_alias()
+            assert(import_comm() is import_component('comm', x))
+            assert(import_comm('default') is import_component('comm', x))
+            assert(import_comm('DefaultComm') is import_component('comm', x))
+    finally:
+        if old_default is None:
+            del os.environ['YGG_DEFAULT_COMM']
+        else:  # pragma: debug
+            os.environ['YGG_DEFAULT_COMM'] = old_default
+        DefaultComm._reset_alias()
+
+
+def test_determine_suffix():
+    r"""Test determine_suffix."""
+    assert_equal(determine_suffix(), '_OUT')
+    assert_equal(determine_suffix(direction='recv'), '_IN')
+    assert_equal(determine_suffix(reverse_names=True), '_IN')
+    assert_equal(determine_suffix(direction='recv', reverse_names=True), '_OUT')
+    assert_equal(determine_suffix(no_suffix=True, direction='recv'), '')
+    assert_raises(ValueError, determine_suffix, direction='invalid')
+
+
 def test_open_file_comm():
     r"""Test file comm context manager."""
     fname = os.path.join(os.path.dirname(__file__),
@@ -24,6 +24,24 @@ def test_registry():
     assert(not CommBase.unregister_comm(comm_class, key))
 
 
+def test_send_serializer():
+    r"""Test the send_serializer keyword and its default."""
+    cases = [
+        ({}, True),
+        ({'single_use': True}, False),
+        ({'single_use': True, 'is_response_server': True}, True),
+        ({'single_use': True, 'send_serializer': True}, True),
+        ({'send_serializer': False}, False),
+        ({'send_serializer': None}, True),
+        ({'single_use': True, 'send_serializer': None}, False)]
+    for kwargs, expected in cases:
+        x = CommBase.CommBase('test', address='address', **kwargs)
+        try:
+            assert_equal(x._send_serializer, expected)
+        finally:
+            x.close()
+
+
 class TestCommBase(YggTestClassInfo):
     r"""Tests for CommBase communication class.
 
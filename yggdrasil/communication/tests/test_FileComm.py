@@ -72,6 +72,25 @@ class TestFileComm(parent.TestCommBase):
         r"""Test file_size method."""
         self.recv_instance.file_size
 
+    def test_flush_every(self):
+        r"""Test that messages are only flushed every flush_every sends."""
+        if not self.send_instance.concats_as_str:
+            return
+        kwargs = self.send_inst_kwargs
+        kwargs['flush_every'] = 2
+        kwargs['address'] = 'flush_every_%s.txt' % self.uuid
+        inst = new_comm(self.name + '_flush', **kwargs)
+        try:
+            self.assert_equal(inst.flush_every, 2)
+            address = inst.current_address
+            assert(inst.send(self.test_msg))
+            self.assert_equal(os.path.getsize(address), 0)
+            assert(inst.send(self.test_msg))
+            assert(os.path.getsize(address) > 0)
+        finally:
+            inst.close()
+            inst.remove_file()
+
     def test_send_recv_filter_send_filter(self, **kwargs):
         r"""Test send/recv with filter that blocks send."""
         kwargs.setdefault('msg_recv', self.recv_instance.eof_msg)
@@ -1,6 +1,7 @@
 """Module for funneling messages from one comm to another."""
 import os
 import copy
+import logging
 import numpy as np
 import functools
 import queue
@@ -290,7 +291,8 @@ class ConnectionDriver(Driver):
             if self.as_process:
                 comm_list[i]['buffer_task_method'] = 'process'
         comm_kws['commtype'] = copy.deepcopy(comm_list)
-        self.debug('%s comm_kws:\n%s', attr_comm, self.pprint(comm_kws, 1))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.debug('%s comm_kws:\n%s', attr_comm, self.pprint(comm_kws, 1))
         setattr(self, attr_comm, new_comm(**comm_kws))
         setattr(self, '%s_kws' % attr_comm, comm_kws)
 
@@ -306,7 +308,8 @@ class ConnectionDriver(Driver):
         if self.icomm.any_files:
             kwargs.setdefault('timeout_send_1st', 60)
         self.timeout_send_1st = kwargs.pop('timeout_send_1st', self.timeout)
-        self.debug('Final env:\n%s', self.pprint(self.env, 1))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.debug('Final env:\n%s', self.pprint(self.env, 1))
 
     def __setstate__(self, state):
         super(ConnectionDriver, self).__setstate__(state)
@@ -819,13 +822,14 @@ class ConnectionDriver(Driver):
 
     def update_serializer(self, msg):
         r"""Update the serializer for the output comm based on input."""
-        self.debug('Before update:\n'
-                   + '  icomm:\n    sinfo:\n%s\n    typedef:\n%s\n'
-                   + '  ocomm:\n    sinfo:\n%s\n    typedef:\n%s',
-                   self.pprint(self.icomm.serializer.serializer_info, 2),
-                   self.pprint(self.icomm.serializer.typedef, 2),
-                   self.pprint(self.ocomm.serializer.serializer_info, 2),
-                   self.pprint(self.ocomm.serializer.typedef, 2))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.debug('Before update:\n'
+                       + '  icomm:\n    sinfo:\n%s\n    typedef:\n%s\n'
+                       + '  ocomm:\n    sinfo:\n%s\n    typedef:\n%s',
+                       self.pprint(self.icomm.serializer.serializer_info, 2),
+                       self.pprint(self.icomm.serializer.typedef, 2),
+                       self.pprint(self.ocomm.serializer.serializer_info, 2),
+                       self.pprint(self.ocomm.serializer.typedef, 2))
         for t in self.translator:
             if isinstance_component(t, 'transform'):
                 t.set_original_datatype(msg.stype)
@@ -840,13 +844,14 @@ class ConnectionDriver(Driver):
             #      and (self.ocomm.serializer.typedef['type'] != 'array')
             #      and (len(self.icomm.serializer.typedef['items']) == 1))):
             self.translator.insert(0, _translate_list2element)
-        self.debug('After update:\n'
-                   + '  icomm:\n    sinfo:\n%s\n    typedef:\n%s\n'
-                   + '  ocomm:\n    sinfo:\n%s\n    typedef:\n%s',
-                   self.pprint(self.icomm.serializer.serializer_info, 2),
-                   self.pprint(self.icomm.serializer.typedef, 2),
-                   self.pprint(self.ocomm.serializer.serializer_info, 2),
-                   self.pprint(self.ocomm.serializer.typedef, 2))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.debug('After update:\n'
+                       + '  icomm:\n    sinfo:\n%s\n    typedef:\n%s\n'
+                       + '  ocomm:\n    sinfo:\n%s\n    typedef:\n%s',
+                       self.pprint(self.icomm.serializer.serializer_info, 2),
+                       self.pprint(self.icomm.serializer.typedef, 2),
+                       self.pprint(self.ocomm.serializer.serializer_info, 2),
+                       self.pprint(self.ocomm.serializer.typedef, 2))
 
     def _send_message(self, *args, **kwargs):
         r"""Send a single message.
@@ -1,3 +1,4 @@
+from yggdrasil import multitasking
 from yggdrasil.drivers.ConnectionDriver import ConnectionDriver, run_remotely
 from yggdrasil.drivers.RPCResponseDriver import RPCResponseDriver
 from yggdrasil.communication import CommBase
@@ -38,11 +39,15 @@ class RPCRequestDriver(ConnectionDriver):
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
-        response_drivers (list): Response drivers created for each request.
+        response_drivers (dict): Response drivers created for each request
+            keyed by the request ID.
+        done_queue (multitasking.Queue): Queue that response drivers are
+            added to when they finish running.
 
     """
 
     _connection_type = 'rpc_request'
+    _disconnect_attr = ConnectionDriver._disconnect_attr + ['done_queue']
 
     def __init__(self, model_request_name, response_kwargs=None, **kwargs):
         # Input communicator
@@ -54,14 +59,18 @@ class RPCRequestDriver(ConnectionDriver):
         # outputs[0]['name'] = model_request_name + '.server_model_request'
         outputs[0]['is_client'] = True
         outputs[0]['close_on_eof_send'] = False
+        outputs[0]['send_serializer'] = True
         kwargs['outputs'] = outputs
-        if response_kwargs is None:
-            response_kwargs = {}
-        self.response_kwargs = response_kwargs
         # Parent and attributes
         super(RPCRequestDriver, self).__init__(model_request_name, **kwargs)
-        self.response_kwargs.setdefault('commtype', self.ocomm._commtype)
-        self.response_drivers = []
+        if response_kwargs is None:
+            response_kwargs = {'commtype': self.ocomm._commtype}
+        else:
+            response_kwargs.setdefault('commtype', self.ocomm._commtype)
+        self.response_kwargs = response_kwargs
+        self.response_drivers = {}
+        self.done_queue = multitasking.Queue()
+        self._pending_response_drivers = []
         self._block_response = False
 
     @property
@@ -82,8 +91,10 @@ class RPCRequestDriver(ConnectionDriver):
         environment variables that need to be provided to the model."""
         out = super(RPCRequestDriver, self).model_env
         # Add is_rpc flag to output model env variables
-        for k in self.ocomm.model_env.keys():
-            out[k]['YGG_IS_SERVER'] = 'True'
+        for k in self.ocomm.model_env:
+            k_env = out.get(k, None)
+            if k_env is not None:
+                k_env['YGG_IS_SERVER'] = 'True'
         return out
         
     def close_response_drivers(self):
@@ -91,9 +102,10 @@ class RPCRequestDriver(ConnectionDriver):
         with self.lock:
             self.debug("Closing response drivers.")
             self._block_response = True
-            for x in self.response_drivers:
+            for x in self.response_drivers.values():
                 x.terminate()
-            self.response_drivers = []
+            self.response_drivers = {}
+            self._pending_response_drivers = []
 
     def close_comm(self):
         r"""Close response drivers."""
@@ -103,7 +115,7 @@ class RPCRequestDriver(ConnectionDriver):
     def printStatus(self, *args, **kwargs):
         r"""Also print response drivers."""
         super(RPCRequestDriver, self).printStatus(*args, **kwargs)
-        for x in self.response_drivers:
+        for x in self.response_drivers.values():
             x.printStatus(*args, **kwargs)
 
     @run_remotely
@@ -151,11 +163,6 @@ class RPCRequestDriver(ConnectionDriver):
         return CommBase.CommMessage(flag=CommBase.FLAG_EMPTY,
                                     args=self.icomm.empty_obj_recv)
 
-    def before_loop(self):
-        r"""Send client sign on to server response driver."""
-        super(RPCRequestDriver, self).before_loop()
-        self.ocomm._send_serializer = True
-
     def send_message(self, msg, **kwargs):
         r"""Start a response driver for a request message and send message with
         header.
@@ -168,7 +175,9 @@ class RPCRequestDriver(ConnectionDriver):
             bool: Success or failure of send.
 
         """
-        if self.ocomm.is_closed:
+        # The flag set by close_comm avoids the is_closed property once
+        # the comms have been closed by this driver
+        if self.check_flag_attr('_comm_closed') or self.ocomm.is_closed:
             return False
         # Start response driver
         if msg.flag != CommBase.FLAG_EOF:
@@ -176,29 +185,50 @@ class RPCRequestDriver(ConnectionDriver):
                 if (not self.is_comm_open) or self._block_response:  # pragma: debug
                     self.debug("Comm closed, not creating response driver.")
                     return False
-                drv_args = [msg.header['response_address'],
-                            msg.header['request_id']]
-                drv_kwargs = dict(
+            header = msg.header
+            model_response_address = header['response_address']
+            request_id = header['request_id']
+            response_commtype = header['commtype']
+            model = header.get('model', '')
+            # The driver is created outside of the lock so that other tasks
+            # are not blocked while its comms are set up
+            self.debug("Creating response comm: address = %s, request_id = %s",
+                       model_response_address, request_id)
+            try:
+                # The response driver updates its input keywords so
+                # response_kwargs must be copied
+                response_driver = RPCResponseDriver(
+                    model_response_address, request_id,
                     request_name=self.name,
                     inputs=[self.response_kwargs.copy()],
-                    outputs=[{'commtype': msg.header["commtype"]}])
-                self.debug("Creating response comm: address = %s, request_id = %s",
-                           msg.header['response_address'], msg.header['request_id'])
+                    outputs=[{'commtype': response_commtype}],
+                    done_queue=self.done_queue)
+            except BaseException:  # pragma: debug
+                self.exception("Could not create response driver.")
+                return False
+            with self.lock:
+                if self._block_response:  # pragma: debug
+                    self.debug("Comm closed, not starting response driver.")
+                    response_driver.cleanup()
+                    return False
+                self.response_drivers[request_id] = response_driver
                 try:
-                    response_driver = RPCResponseDriver(*drv_args, **drv_kwargs)
-                    self.response_drivers.append(response_driver)
                     response_driver.start()
-                    self.debug("Started response comm: address = %s, request_id = %s",
-                               msg.header['response_address'], msg.header['request_id'])
                 except BaseException:  # pragma: debug
-                    self.exception("Could not create/start response driver.")
+                    self.exception("Could not start response driver.")
+                    self.response_drivers.pop(request_id, None)
+                    response_driver.cleanup()
                     return False
-            # Send response address in header
-            kwargs.setdefault('header_kwargs', {})
-            kwargs['header_kwargs'].setdefault(
-                'response_address', response_driver.response_address)
-            kwargs['header_kwargs'].setdefault('request_id', msg.header['request_id'])
-            kwargs['header_kwargs'].setdefault('model', msg.header.get('model', ''))
+            self.debug("Started response comm: address = %s, request_id = %s",
+                       model_response_address, request_id)
+            # Send response address in header (values provided by the caller
+            # take precedence)
+            header_kwargs = {'response_address': response_driver.response_address,
+                             'request_id': request_id,
+                             'model': model}
+            if kwargs.get('header_kwargs', None):
+                header_kwargs.update(kwargs['header_kwargs'])
+            kwargs['header_kwargs'] = header_kwargs
         return super(RPCRequestDriver, self).send_message(msg, **kwargs)
 
     def run_loop(self):
@@ -211,13 +241,24 @@ class RPCRequestDriver(ConnectionDriver):
 
     def prune_response_drivers(self):
         r"""Remove response drivers that are no longer being used."""
+        # Avoid acquiring the lock when no drivers have finished. A driver
+        # that finishes after this check will be pruned on the next pass.
+        if self.done_queue.empty() and (not self._pending_response_drivers):
+            return
         with self.lock:
-            remove_idx = []
-            for i, x in enumerate(self.response_drivers):
+            # Only drivers that have finished running are checked
+            finished = self._pending_response_drivers
+            while not self.done_queue.empty():
+                finished.append(self.done_queue.get_nowait())
+            # Finished drivers with unconfirmed messages are kept outside of
+            # the queue so that they do not defeat the check above
+            self._pending_response_drivers = []
+            for x in finished:
                 if (((not x.is_alive())
                      and x.icomm.is_confirmed_recv
                      and x.ocomm.is_confirmed_send)):
                     x.cleanup()
-                    remove_idx.append(i)
-            for i in remove_idx[::-1]:
-                self.response_drivers.pop(i)
+                    self.response_drivers.pop(x.msg_id, None)
+                else:
+                    # Check again on the next pass
+                    self._pending_response_drivers.append(x)
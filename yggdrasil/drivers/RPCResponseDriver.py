@@ -9,18 +9,24 @@ class RPCResponseDriver(ConnectionDriver):
             client model to receive responses.
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
+        done_queue (multitasking.Queue, optional): Queue that the driver
+            should be added to when it finishes running so that the request
+            driver that created it can clean it up. Defaults to None.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
+        done_queue (multitasking.Queue): Queue that the driver will be added
+            to when it finishes running.
         response_drivers (list): Response drivers created for each request.
 
     """
 
     _connection_type = 'rpc_response'
 
-    def __init__(self, model_response_address, msg_id, **kwargs):
+    def __init__(self, model_response_address, msg_id, done_queue=None,
+                 **kwargs):
         # Input communicator
         inputs = kwargs.get('inputs', [{}])
         inputs[0]['name'] = 'server_model_response.' + msg_id
@@ -37,6 +43,15 @@ class RPCResponseDriver(ConnectionDriver):
         super(RPCResponseDriver, self).__init__('rpc_response.' + msg_id,
                                                 **kwargs)
         self.msg_id = msg_id
+        self.done_queue = done_queue
+
+    def run(self, *args, **kwargs):
+        r"""Run the driver, adding it to the done queue on completion."""
+        try:
+            super(RPCResponseDriver, self).run(*args, **kwargs)
+        finally:
+            if self.done_queue is not None:
+                self.done_queue.put(self)
 
     @property
     def response_address(self):
@@ -137,12 +137,16 @@ class TestConnectionParam(parent.TestParam):
     @property
     def icomm_import_cls(self):
         r"""class: Class used for connection input comm."""
-        return import_component('comm', self.icomm_name)
+        if getattr(self, '_icomm_import_cls', None) is None:
+            self._icomm_import_cls = import_component('comm', self.icomm_name)
+        return self._icomm_import_cls
 
     @property
     def ocomm_import_cls(self):
         r"""class: Class used for connection output comm."""
-        return import_component('comm', self.ocomm_name)
+        if getattr(self, '_ocomm_import_cls', None) is None:
+            self._ocomm_import_cls = import_component('comm', self.ocomm_name)
+        return self._ocomm_import_cls
 
     @property
     def send_comm_kwargs(self):
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 from yggdrasil.schema import get_schema
 from yggdrasil.tests import assert_raises, assert_equal
 import yggdrasil.drivers.tests.test_ConnectionDriver as parent
@@ -50,6 +51,37 @@ class TestRPCRequestDriverNoStart(TestRPCRequestParam,
         for k in err_attr:
             assert_raises(AttributeError, getattr, self.instance, k)
 
+    def test_send_serializer(self):
+        r"""Test that the output comm will send the serializer before the
+        loop is started."""
+        assert(self.instance.outputs[0]['send_serializer'])
+        assert(self.instance.ocomm._send_serializer)
+
+    def test_prune_response_drivers(self):
+        r"""Test pruning of finished response drivers."""
+        # The lock is not acquired if no drivers have finished
+        with mock.patch.object(self.instance, 'lock') as lock:
+            self.instance.prune_response_drivers()
+            assert(not lock.__enter__.called)
+        # Finished drivers with unconfirmed messages are checked again on
+        # the next pass
+        x = mock.MagicMock(msg_id='test_request')
+        x.is_alive.return_value = False
+        x.icomm.is_confirmed_recv = False
+        x.ocomm.is_confirmed_send = True
+        self.instance.response_drivers[x.msg_id] = x
+        self.instance.done_queue.put(x)
+        self.instance.prune_response_drivers()
+        assert(self.instance.done_queue.empty())
+        assert_equal(self.instance._pending_response_drivers, [x])
+        assert_equal(self.instance.response_drivers, {x.msg_id: x})
+        assert(not x.cleanup.called)
+        x.icomm.is_confirmed_recv = True
+        self.instance.prune_response_drivers()
+        assert_equal(self.instance._pending_response_drivers, [])
+        assert_equal(self.instance.response_drivers, {})
+        assert(x.cleanup.called)
+
 
 class TestRPCRequestDriverNoInit(TestRPCRequestParam,
                                  parent.TestConnectionDriverNoInit):
@@ -102,6 +134,17 @@ class TestRPCRequestDriver(TestRPCRequestParam,
         r"""Test routing of a large message between client and server."""
         self.test_send_recv(msg_send=self.msg_long)
 
+    def test_prune_response_drivers(self):
+        r"""Test that response drivers are pruned after they finish."""
+        self.test_send_recv()
+        T = self.instance.start_timeout(self.route_timeout)
+        while ((not T.is_out) and self.instance.response_drivers):
+            self.instance.sleep()
+        self.instance.stop_timeout()
+        assert_equal(len(self.instance.response_drivers), 0)
+        assert(self.instance.done_queue.empty())
+        assert_equal(self.instance._pending_response_drivers, [])
+
 
 # Dynamically create tests based on registered comm classes
 s = get_schema()
@@ -5,6 +5,7 @@ from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
 
 class AnyMetaschemaType(MetaschemaType):
     r"""Type associated with a scalar."""
+    __slots__ = []
 
     name = 'any'
     description = 'A type allowing any value that is expresible in some type.'
@@ -6,6 +6,7 @@ from yggdrasil.metaschema.properties import ScalarMetaschemaProperties
 
 class OneDArrayMetaschemaType(ScalarMetaschemaType):
     r"""Type associated with a scalar."""
+    __slots__ = []
 
     name = '1darray'
     description = 'A 1D array with or without units.'
@@ -38,6 +39,7 @@ class OneDArrayMetaschemaType(ScalarMetaschemaType):
 
 class NDArrayMetaschemaType(ScalarMetaschemaType):
     r"""Type associated with a scalar."""
+    __slots__ = []
 
     name = 'ndarray'
     description = 'An ND array with or without units.'
@@ -7,6 +7,7 @@ from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
 
 class ClassMetaschemaType(MetaschemaType):
     r"""Type for evaluating classes."""
+    __slots__ = []
 
     name = 'class'
     description = 'Type for Python classes.'
@@ -1,3 +1,4 @@
+import copy
 from yggdrasil.metaschema.datatypes import (
     get_type_class, complete_typedef, encode_data, encode_data_readable)
 from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
@@ -5,6 +6,7 @@ from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
 
 class ContainerMetaschemaType(MetaschemaType):
     r"""Type associated with a container of subtypes."""
+    __slots__ = ['_typecls']
 
     name = 'container'
     description = 'A container of other types.'
@@ -217,6 +219,8 @@ class ContainerMetaschemaType(MetaschemaType):
         if cls._json_property in out:
             contents = out[cls._json_property]
             if isinstance(contents, cls.python_types):
+                # Copy so that the metadata's contents are not modified
+                contents = copy.copy(contents)
                 for k, v in cls._iterate(contents):
                     if 'type' in v:
                         vcls = get_type_class(v['type'])
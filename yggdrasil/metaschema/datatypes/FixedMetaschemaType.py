@@ -33,7 +33,8 @@ def create_fixed_type_class(name, description, base, fixed_properties,
     iattr = {'name': name,
              'description': description,
              'fixed_properties': fixed_properties,
-             'specificity': base.specificity + 1}
+             'specificity': base.specificity + 1,
+             '__slots__': []}
     iattr.update(kwargs)
     for k in ['properties', 'definition_properties', 'metadata_properties']:
         iattr[k] = copy.deepcopy(getattr(base, k))
@@ -65,6 +66,7 @@ class FixedMetaschemaType(MetaschemaType):
             fixed and the values they are fixed to.
 
     """
+    __slots__ = []
 
     is_fixed = True
     fixed_properties = {}
@@ -5,6 +5,7 @@ from yggdrasil.metaschema.datatypes.ClassMetaschemaType import (
 
 class FunctionMetaschemaType(ClassMetaschemaType):
     r"""Type for evaluating functions."""
+    __slots__ = []
 
     name = 'function'
     description = 'Type for callable Python functions.'
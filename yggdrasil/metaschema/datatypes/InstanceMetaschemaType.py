@@ -12,6 +12,7 @@ from yggdrasil.metaschema.properties.KwargsMetaschemaProperty import (
 
 class InstanceMetaschemaType(MetaschemaType):
     r"""Type for evaluating instances of Python classes."""
+    __slots__ = []
 
     name = 'instance'
     description = 'Type for Python class instances.'
@@ -12,6 +12,7 @@ class JSONArrayMetaschemaType(ContainerMetaschemaType):
         Support for dynamic arrays in C/C++ is still under development.
 
     """
+    __slots__ = []
 
     name = 'array'
     description = 'A container of ordered values.'
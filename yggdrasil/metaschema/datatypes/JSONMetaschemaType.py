@@ -5,6 +5,7 @@ from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
 
 class JSONMetaschemaTypeBase(MetaschemaType):
     r"""Base type for default JSON types."""
+    __slots__ = []
 
     name = 'json'
     description = 'A json base type.'
@@ -44,6 +45,7 @@ class JSONMetaschemaTypeBase(MetaschemaType):
 
 class JSONBooleanMetaschemaType(JSONMetaschemaTypeBase):
     r"""JSON base boolean type."""
+    __slots__ = []
 
     name = 'boolean'
     description = 'JSON boolean type.'
@@ -71,6 +73,7 @@ class JSONBooleanMetaschemaType(JSONMetaschemaTypeBase):
 
 class JSONIntegerMetaschemaType(JSONMetaschemaTypeBase):
     r"""JSON base integer type."""
+    __slots__ = []
 
     name = 'integer'
     description = 'JSON integer type.'
@@ -99,6 +102,7 @@ class JSONIntegerMetaschemaType(JSONMetaschemaTypeBase):
 
 class JSONNullMetaschemaType(JSONMetaschemaTypeBase):
     r"""JSON base null type."""
+    __slots__ = []
 
     name = 'null'
     description = 'JSON null type.'
@@ -113,6 +117,7 @@ class JSONNumberMetaschemaType(JSONMetaschemaTypeBase):
         This covers the JSON default for floating point or integer values.
 
     """
+    __slots__ = []
 
     name = 'number'
     description = 'JSON number type.'
@@ -144,6 +149,7 @@ class JSONStringMetaschemaType(JSONMetaschemaTypeBase):
         Encoding dependent on JSON library.
 
     """
+    __slots__ = []
 
     name = 'string'
     description = 'JSON string type.'
@@ -12,6 +12,7 @@ class JSONObjectMetaschemaType(ContainerMetaschemaType):
         Support for dynamic objects in C/C++ is still under development.
 
     """
+    __slots__ = []
 
     name = 'object'
     description = 'A container mapping between keys and values.'
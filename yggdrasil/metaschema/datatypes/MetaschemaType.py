@@ -72,6 +72,9 @@ class MetaschemaType(object):
 
     """
 
+    # Subclasses should also define __slots__ (empty if they do not add any
+    # instance attributes) so that instances are created without a __dict__
+    __slots__ = ['_typedef']
     name = 'base'
     description = 'A generic base type for users to build on.'
     properties = ['type', 'title']
@@ -89,6 +92,8 @@ class MetaschemaType(object):
     _empty_msg = b''
     _replaces_existing = False
     _json_type = None
+    _validator_cache = None
+    _schema_cache = None
     
     def __init__(self, **typedef):
         self._typedef = {}
@@ -247,6 +252,9 @@ class MetaschemaType(object):
             typedef (dict, optional): Type properties that should be used to
                 initialize the encoded type definition in certain cases.
                 Defaults to None and is ignored.
+            is_validated (bool, optional): If True, the object is taken as
+                already having been validated as this type and will not be
+                validated again. Defaults to False.
             **kwargs: Additional keyword arguments are treated as additional
                 schema properties.
 
@@ -289,7 +297,7 @@ class MetaschemaType(object):
             list: Keywords that should be kept in the typedef.
 
         """
-        return copy.deepcopy(cls.extract_properties)
+        return list(cls.extract_properties)
 
     @classmethod
     def extract_typedef(cls, metadata, reqkeys=None):
@@ -305,14 +313,10 @@ class MetaschemaType(object):
             dict: Encoded type definition with unncessary properties removed.
 
         """
-        out = copy.deepcopy(metadata)
         if reqkeys is None:
             reqkeys = cls.get_extract_properties(metadata)
-        keylist = [k for k in out.keys()]
-        for k in keylist:
-            if k not in reqkeys:
-                del out[k]
-        return out
+        reqkeys = set(reqkeys)
+        return {k: v for k, v in metadata.items() if k in reqkeys}
 
     def update_typedef(self, **kwargs):
         r"""Update the current typedef with new values.
@@ -339,11 +343,9 @@ class MetaschemaType(object):
                 "Cannot update typedef for type '%s' to be '%s'."
                 % (typename0, typename1))  # pragma: debug
         # Copy over valid properties
-        all_keys = [k for k in kwargs.keys()]
         # req_keys = self.definition_schema().get('required', [])
-        for k in all_keys:
-            # if k in req_keys:
-            self._typedef[k] = kwargs.pop(k)
+        self._typedef.update(kwargs)
+        kwargs.clear()
         # Validate
         self.validate_definition(self._typedef)
         return kwargs
@@ -360,31 +362,85 @@ class MetaschemaType(object):
 
     @classmethod
     def definition_schema(cls):
-        r"""JSON schema for validating a type definition schema."""
-        out = {'title': cls.name,
-               'description': cls.description,
-               'type': 'object',
-               'required': copy.deepcopy(cls.definition_properties),
-               'properties': {'type': {'enum': [cls.name]}}}
-        return out
+        r"""JSON schema for validating a type definition schema. The schema
+        is created once for each class and should not be modified."""
+        cache = cls._get_class_cache('_schema_cache')
+        if 'definition' not in cache:
+            cache['definition'] = {
+                'title': cls.name,
+                'description': cls.description,
+                'type': 'object',
+                'required': copy.deepcopy(cls.definition_properties),
+                'properties': {'type': {'enum': [cls.name]}}}
+        return cache['definition']
 
     @classmethod
     def metadata_schema(cls):
-        r"""JSON schema for validating a JSON serialization of the type."""
-        out = {'title': cls.name,
-               'description': cls.description,
-               'type': 'object',
-               'required': copy.deepcopy(cls.metadata_properties),
-               'properties': {'type': {'enum': [cls.name]}}}
+        r"""JSON schema for validating a JSON serialization of the type. The
+        schema is created once for each class and should not be modified."""
+        cache = cls._get_class_cache('_schema_cache')
+        if 'metadata' not in cache:
+            cache['metadata'] = {
+                'title': cls.name,
+                'description': cls.description,
+                'type': 'object',
+                'required': copy.deepcopy(cls.metadata_properties),
+                'properties': {'type': {'enum': [cls.name]}}}
+        return cache['metadata']
+
+    @classmethod
+    def _get_class_cache(cls, name):
+        r"""Get a cache dictionary that belongs to this class. The cache is
+        stored in the class's __dict__ so that it is not shared with parent
+        classes or subclasses.
+
+        Args:
+            name (str): Name of the class attribute used to store the cache.
+
+        Returns:
+            dict: Cache for this class.
+
+        """
+        out = cls.__dict__.get(name, None)
+        if out is None:
+            out = {}
+            setattr(cls, name, out)
         return out
 
     @classmethod
-    def validate_metadata(cls, obj, **kwargs):
-        r"""Validates an encoded object.
+    def _get_validator(cls, schema_type):
+        r"""Get the cached validator for one of the type's schemas. The
+        validator is created the first time it is requested for a class
+        and re-created if the global validator class has been replaced.
 
         Args:
-            obj (string): Encoded object to validate.
-            **kwargs: Additional keyword arguments are passed to the validator.
+            schema_type (str): Schema that the validator should use. Valid
+                values include 'metadata' and 'definition'.
+
+        Returns:
+            jsonschema.IValidator: Validator instance for the schema.
+
+        """
+        validator_cls = get_validator()
+        cache = cls._get_class_cache('_validator_cache')
+        out = cache.get(schema_type, None)
+        if (out is None) or (not isinstance(out, validator_cls)):
+            schema = getattr(cls, '%s_schema' % schema_type)()
+            validator_cls.check_schema(schema)
+            out = validator_cls(schema)
+            cache[schema_type] = out
+        return out
+
+    @classmethod
+    def _metadata_fixed2base(cls, obj):
+        r"""Convert metadata for a fixed subtype of this type into metadata
+        for this type so that it can be validated against this type's schema.
+
+        Args:
+            obj (object): Metadata to convert.
+
+        Returns:
+            object: Converted metadata.
 
         """
         if ((isinstance(obj, dict) and ('type' in obj)
@@ -392,9 +448,24 @@ class MetaschemaType(object):
             type_cls = get_type_class(obj['type'])
             if type_cls.is_fixed and type_cls.issubtype(cls.name):
                 obj = type_cls.typedef_fixed2base(obj)
+        return obj
+
+    @classmethod
+    def validate_metadata(cls, obj, **kwargs):
+        r"""Validates an encoded object.
+
+        Args:
+            obj (string): Encoded object to validate.
+            **kwargs: Additional keyword arguments are passed to the validator.
+
+        """
+        obj = cls._metadata_fixed2base(obj)
         # jsonschema.validate(obj, cls.metaschema(), cls=cls.validator())
         # jsonschema.validate(obj, cls.metadata_schema(), cls=cls.validator())
-        return validate_instance(obj, cls.metadata_schema(), **kwargs)
+        if kwargs.get('normalize', False):
+            # Normalization stores state on the validator so it is not shared
+            return validate_instance(obj, cls.metadata_schema(), **kwargs)
+        return cls._get_validator('metadata').validate(obj, **kwargs)
 
     @classmethod
     def validate_definition(cls, obj, **kwargs):
@@ -407,7 +478,39 @@ class MetaschemaType(object):
         """
         # jsonschema.validate(obj, cls.metaschema(), cls=cls.validator())
         # jsonschema.validate(obj, cls.definition_schema(), cls=cls.validator())
-        return validate_instance(obj, cls.definition_schema(), **kwargs)
+        if kwargs.get('normalize', False):
+            # Normalization stores state on the validator so it is not shared
+            return validate_instance(obj, cls.definition_schema(), **kwargs)
+        return cls._get_validator('definition').validate(obj, **kwargs)
+
+    @classmethod
+    def is_valid_metadata(cls, obj):
+        r"""Determine if an encoded object is valid without raising an
+        error.
+
+        Args:
+            obj (string): Encoded object to validate.
+
+        Returns:
+            bool: True if the object is valid, False otherwise.
+
+        """
+        obj = cls._metadata_fixed2base(obj)
+        return cls._get_validator('metadata').is_valid(obj)
+
+    @classmethod
+    def is_valid_definition(cls, obj):
+        r"""Determine if a type definition is valid without raising an
+        error.
+
+        Args:
+            obj (object): Type definition to validate.
+
+        Returns:
+            bool: True if the type definition is valid, False otherwise.
+
+        """
+        return cls._get_validator('definition').is_valid(obj)
 
     @classmethod
     def validate_instance(cls, obj, typedef, **kwargs):
@@ -468,19 +571,15 @@ class MetaschemaType(object):
 
         """
         if not metadata_validated:
-            try:
+            if raise_errors:
                 cls.validate_metadata(metadata)
-            except jsonschema.exceptions.ValidationError:
-                if raise_errors:
-                    raise
+            elif not cls.is_valid_metadata(metadata):
                 return False
         if typedef is not None:
             if not typedef_validated:
-                try:
+                if raise_errors:
                     cls.validate_definition(typedef)
-                except jsonschema.exceptions.ValidationError:
-                    if raise_errors:
-                        raise
+                elif not cls.is_valid_definition(typedef):
                     return False
             errors = [e for e in compare_schema(metadata, typedef)]
             if errors:
@@ -518,11 +617,9 @@ class MetaschemaType(object):
             return True
         # Validate definition
         if not typedef_validated:
-            try:
+            if raise_errors:
                 cls.validate_definition(typedef)
-            except jsonschema.exceptions.ValidationError:
-                if raise_errors:
-                    raise
+            elif not cls.is_valid_definition(typedef):
                 return False
         # Validate instance against definition
         try:
@@ -569,8 +666,9 @@ class MetaschemaType(object):
             cls.check_decoded(obj, typedef, raise_errors=True,
                               typedef_validated=typedef_validated)
         obj_t = cls.transform_type(obj, typedef)
-        # Encode
-        metadata = cls.encode_type(obj_t, typedef=typedef)
+        # Encode (skipping validation if the object was already checked)
+        metadata = cls.encode_type(obj_t, typedef=typedef,
+                                   is_validated=(not dont_check))
         data = cls.encode_data(obj_t, metadata)
         return metadata, data
 
@@ -668,7 +766,8 @@ class MetaschemaType(object):
             return data
         metadata['size'] = len(data)
         metadata.setdefault('id', str(uuid.uuid4()))
-        header = YGG_MSG_HEAD + encoder.encode_json(metadata) + YGG_MSG_HEAD
+        header = YGG_MSG_HEAD + encoder.encode_json_header(metadata) + YGG_MSG_HEAD
+        data_prefix = b''
         if (max_header_size > 0) and (len(header) > max_header_size):
             metadata_type = metadata
             metadata = {}
@@ -678,15 +777,16 @@ class MetaschemaType(object):
                 if k in metadata_type:
                     metadata[k] = metadata_type.pop(k)
             assert(metadata)
-            data = (encoder.encode_json(metadata_type) + YGG_MSG_HEAD + data)
-            metadata['size'] = len(data)
+            data_prefix = encoder.encode_json(metadata_type) + YGG_MSG_HEAD
+            metadata['size'] = len(data_prefix) + len(data)
             metadata['type_in_data'] = True
-            header = YGG_MSG_HEAD + encoder.encode_json(metadata) + YGG_MSG_HEAD
+            header = YGG_MSG_HEAD + encoder.encode_json_header(metadata) + YGG_MSG_HEAD
             if len(header) > max_header_size:  # pragma: debug
                 raise AssertionError(("The header is larger (%d) than the "
                                       "maximum (%d): %.100s...")
                                      % (len(header), max_header_size, header))
-        msg = header + data
+        # Join in one pass so that large data is only copied once
+        msg = b''.join([header, data_prefix, data])
         return msg
     
     def deserialize(self, msg, no_data=False, metadata=None, dont_decode=False,
@@ -726,8 +826,9 @@ class MetaschemaType(object):
             else:
                 metadata = encoder.decode_json(metadata)
         elif isinstance(metadata, dict) and metadata.get('type_in_data', False):
-            assert(msg.count(YGG_MSG_HEAD) == 1)
-            typedef, data = msg.split(YGG_MSG_HEAD, 1)
+            typedef, sep, data = msg.partition(YGG_MSG_HEAD)
+            if not sep:  # pragma: debug
+                raise ValueError("Header marker not in message.")
             if len(typedef) > 0:
                 metadata.update(encoder.decode_json(typedef))
             metadata.pop('type_in_data')
@@ -25,13 +25,14 @@ def create_multitype_class(types):
         type_classes[t] = get_type_class(t)
     out = type(class_name, (MultiMetaschemaType, ),
                {'type_classes': type_classes,
-                'name': type_name})
+                'name': type_name, '__slots__': []})
     return out
 
 
 class MultiMetaschemaType(MetaschemaType):
     r"""Type class for handling behavior when more than one type is
     valid."""
+    __slots__ = ['type_instances']
     
     _dont_register = True
     inherit_properties = False
@@ -245,31 +246,39 @@ class MultiMetaschemaType(MetaschemaType):
 
     @classmethod
     def definition_schema(cls):
-        r"""JSON schema for validating a type definition schema."""
-        types = list(cls.type_classes.keys())
-        out = {'title': cls.name,
-               'description': cls.description,
-               'type': 'object',
-               'required': copy.deepcopy(cls.definition_properties),
-               'properties': {'type': {'oneOf': [
-                   {'enum': types},
-                   {'type': 'array',
-                    'items': {'enum': types}}]}}}
-        return out
+        r"""JSON schema for validating a type definition schema. The schema
+        is created once for each class and should not be modified."""
+        cache = cls._get_class_cache('_schema_cache')
+        if 'definition' not in cache:
+            types = list(cls.type_classes.keys())
+            cache['definition'] = {
+                'title': cls.name,
+                'description': cls.description,
+                'type': 'object',
+                'required': copy.deepcopy(cls.definition_properties),
+                'properties': {'type': {'oneOf': [
+                    {'enum': types},
+                    {'type': 'array',
+                     'items': {'enum': types}}]}}}
+        return cache['definition']
 
     @classmethod
     def metadata_schema(cls):
-        r"""JSON schema for validating a JSON serialization of the type."""
-        types = list(cls.type_classes.keys())
-        out = {'title': cls.name,
-               'description': cls.description,
-               'type': 'object',
-               'required': copy.deepcopy(cls.metadata_properties),
-               'properties': {'type': {'oneOf': [
-                   {'enum': types},
-                   {'type': 'array',
-                    'items': {'enum': types}}]}}}
-        return out
+        r"""JSON schema for validating a JSON serialization of the type. The
+        schema is created once for each class and should not be modified."""
+        cache = cls._get_class_cache('_schema_cache')
+        if 'metadata' not in cache:
+            types = list(cls.type_classes.keys())
+            cache['metadata'] = {
+                'title': cls.name,
+                'description': cls.description,
+                'type': 'object',
+                'required': copy.deepcopy(cls.metadata_properties),
+                'properties': {'type': {'oneOf': [
+                    {'enum': types},
+                    {'type': 'array',
+                     'items': {'enum': types}}]}}}
+        return cache['metadata']
 
     @classmethod
     def _generate_data(cls, typedef):
@@ -737,6 +737,7 @@ else:
 # what the base class is determined to be on loading the schema
 class ObjMetaschemaType(JSONObjectMetaschemaType):
     r"""Obj 3D structure map."""
+    __slots__ = []
 
     _empty_msg = {'vertices': [], 'faces': []}
     python_types = python_types
@@ -778,6 +778,7 @@ else:
 # what the base class is determined to be on loading the schema
 class PlyMetaschemaType(JSONObjectMetaschemaType):
     r"""Ply 3D structure map."""
+    __slots__ = []
 
     _empty_msg = {'vertices': [], 'faces': []}
     python_types = python_types
@@ -18,6 +18,7 @@ class ScalarMetaschemaType(MetaschemaType):
         float, bytes, and unicode.
 
     """
+    __slots__ = []
 
     name = 'scalar'
     description = 'A scalar value with or without units.'
@@ -80,6 +80,7 @@ def _validate_schema(validator, ref, instance, schema):
         
 class SchemaMetaschemaType(JSONObjectMetaschemaType):
     r"""Schema type."""
+    __slots__ = []
 
     name = 'schema'
     description = 'A schema type for evaluating subschema.'
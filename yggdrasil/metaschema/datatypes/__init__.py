@@ -257,9 +257,9 @@ def get_type_class(type_name):
         class: Type class.
 
     """
-    from yggdrasil.metaschema.datatypes.MultiMetaschemaType import (
-        create_multitype_class)
     if isinstance(type_name, list):
+        from yggdrasil.metaschema.datatypes.MultiMetaschemaType import (
+            create_multitype_class)
         return create_multitype_class(type_name)
     out = _type_registry.get(type_name, None)
     if out is None:
@@ -508,6 +508,9 @@ def compare_schema(schema1, schema2, root1=None, root2=None):
 
     """
     try:
+        # Identical typed schemas are compatible, skip creating resolvers
+        if ('type' in schema1) and (schema1 == schema2):
+            return
         if root1 is None:
             root1 = jsonschema.RefResolver.from_schema(schema1)
         if root2 is None:
@@ -542,8 +545,10 @@ def compare_schema(schema1, schema2, root1=None, root2=None):
                 # Compare contents of schema
                 ierrors = []
                 for k, v in ischema2.items():
+                    if k in ('title', 'default'):
+                        continue
                     prop_cls = get_metaschema_property(k, skip_generic=True)
-                    if (prop_cls is None) or (k in ['title', 'default']):
+                    if prop_cls is None:
                         continue
                     if k not in schema1:
                         ierrors.append("Missing entry for required key '%s'" % k)
@@ -1,3 +1,6 @@
+import copy
+import jsonschema
+from unittest import mock
 from yggdrasil.tests import assert_raises, assert_equal
 from yggdrasil.metaschema import datatypes
 from yggdrasil.metaschema.tests import _valid_objects
@@ -91,7 +94,11 @@ def test_compare_schema():
         ({'type': 'object', 'properties': {'x': {'type': 'float'}}},
          {'type': 'object', 'properties': {'x': {'type': 'float'},
                                            'y': {'type': 'float'}},
-          'required': ['x']})]
+          'required': ['x']}),
+        ({'type': 'object', 'definitions': {'a': {'type': 'int'}},
+          'properties': {'x': {'$ref': '#/definitions/a'}}},
+         {'type': 'object', 'definitions': {'a': {'type': 'int'}},
+          'properties': {'x': {'$ref': '#/definitions/a'}}})]
     invalid = [
         ({'type': 'int'}, {}), ({}, {'type': 'int'}),
         ({'type': 'int'}, {'type': 'int', 'precision': 4}),
@@ -105,3 +112,17 @@ def test_compare_schema():
     for x in invalid:
         errors = list(datatypes.compare_schema(*x))
         assert(errors)
+
+
+def test_compare_schema_identical():
+    r"""Test that compare_schema does not create resolvers for identical
+    schemas."""
+    x = {'type': 'object', 'definitions': {'a': {'type': 'int'}},
+         'properties': {'x': {'$ref': '#/definitions/a'}}}
+    with mock.patch.object(jsonschema.RefResolver, 'from_schema',
+                           side_effect=RuntimeError("Resolver created")):
+        assert(not list(datatypes.compare_schema(x, copy.deepcopy(x))))
+        # Schemas without a type are not short-circuited
+        errors = list(datatypes.compare_schema({}, {}))
+        assert_equal(len(errors), 1)
+        assert(isinstance(errors[0], RuntimeError))
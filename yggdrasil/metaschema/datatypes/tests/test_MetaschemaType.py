@@ -154,7 +154,9 @@ class TestMetaschemaType(YggTestClassInfo):
     def test_extract_typedef(self):
         r"""Test extract_typedef."""
         if len(self._valid_encoded) > 0:
-            self.import_cls.extract_typedef(self._valid_encoded[0])
+            x = copy.deepcopy(self._valid_encoded[0])
+            self.import_cls.extract_typedef(x)
+            self.assert_equal(x, self._valid_encoded[0])
 
     def test_update_typedef(self):
         r"""Test update_typedef raises error on non-matching typename."""
@@ -167,16 +169,35 @@ class TestMetaschemaType(YggTestClassInfo):
 
     def test_definition_schema(self):
         r"""Test definition schema."""
-        s = self.import_cls.definition_schema()
+        import_cls = self.import_cls
+        s = import_cls.definition_schema()
+        assert(import_cls.definition_schema() is s)
         # jsonschema.Draft3Validator.check_schema(s)
         jsonschema.Draft4Validator.check_schema(s)
 
     def test_metadata_schema(self):
         r"""Test metadata schema."""
-        s = self.import_cls.metadata_schema()
+        import_cls = self.import_cls
+        s = import_cls.metadata_schema()
+        assert(import_cls.metadata_schema() is s)
         # jsonschema.Draft3Validator.check_schema(s)
         jsonschema.Draft4Validator.check_schema(s)
 
+    def test_get_validator(self):
+        r"""Test that validators for the type's schemas are cached."""
+        import_cls = self.import_cls
+        for k in ['definition', 'metadata']:
+            v1 = import_cls._get_validator(k)
+            v2 = import_cls._get_validator(k)
+            assert(v1 is v2)
+            self.assert_equal(v1.schema, getattr(import_cls, '%s_schema' % k)())
+
+    def test_is_valid(self):
+        r"""Test is_valid_metadata and is_valid_definition."""
+        assert(self.import_cls.is_valid_definition(self.typedef))
+        for x in self._valid_encoded:
+            assert(self.import_cls.is_valid_metadata(x))
+
     def test_encode_data(self):
         r"""Test encode/decode data & type."""
         if self._cls == 'MetaschemaType':
@@ -3,6 +3,10 @@ import json as stdjson
 import yaml
 import rapidjson as json
 from yggdrasil import tools
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 _json_encoder = json.Encoder
 _json_decoder = json.Decoder
 
@@ -113,6 +117,48 @@ def encode_json(obj, fd=None, indent=None, sort_keys=True, **kwargs):
         return json.dump(obj, fd, **kwargs)
 
 
+def _orjson_default(o):
+    r"""Default function for orjson that handles types orjson does not
+    serialize natively in the same way as rapidjson."""
+    if isinstance(o, bytes):
+        return tools.bytes2str(o)
+    elif isinstance(o, float):
+        return float(o)
+    return JSONEncoder().default(o)
+
+
+def encode_json_header(obj, sort_keys=False):
+    r"""Encode a message header in compact JSON format. If orjson is
+    installed, it will be used to perform the encoding.
+
+    Args:
+        obj (dict): Header to encode.
+        sort_keys (bool, optional): If True, the keys will be output in sorted
+            order. Defaults to False as headers are always decoded into a
+            dictionary.
+
+    Returns:
+        bytes: Encoded header.
+
+    .. note:: orjson encodes NaN and infinite floats as null so headers
+              whose orjson encoding contains null are re-encoded with
+              encode_json to preserve them.
+
+    """
+    if orjson is not None:
+        option = 0
+        if sort_keys:
+            option = orjson.OPT_SORT_KEYS
+        try:
+            out = orjson.dumps(obj, default=_orjson_default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if b'null' not in out:
+                return out
+    return encode_json(obj, sort_keys=sort_keys)
+
+
 def decode_json(msg, **kwargs):
     r"""Decode a Python object from a JSON serialization.
 
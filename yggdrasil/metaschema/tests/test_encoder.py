@@ -1,4 +1,5 @@
 import io as sio
+import numpy as np
 from collections import OrderedDict
 from yggdrasil.metaschema import encoder
 from yggdrasil.tests import assert_raises
@@ -14,6 +15,32 @@ def test_JSONEncoder():
     assert_raises(TypeError, encoder.encode_json, x)
 
 
+def test_encode_json_header():
+    r"""Test that encode_json_header matches encode_json."""
+    x = {'size': 10, 'id': 'abc', 'address': b'address', 'value': np.float64(1.5),
+         'datatype': OrderedDict([('type', 'array'), ('items', [{'type': 'int'}])])}
+    assert(encoder.encode_json_header(x, sort_keys=True)
+           == encoder.encode_json(x))
+    assert(encoder.encode_json_header(x)
+           == encoder.encode_json(x, sort_keys=False))
+    if encoder.orjson is not None:
+        assert(encoder.encode_json_header(x)
+               == encoder.orjson.dumps(x, default=encoder._orjson_default))
+    # Integers outside of the 64-bit range orjson supports
+    y = {'big': 2**70}
+    assert(encoder.encode_json_header(y) == encoder.encode_json(y))
+    # Non-finite floats that orjson would encode as null
+    for v in [float('nan'), float('inf'), np.float64('-inf')]:
+        z = encoder.decode_json(encoder.encode_json_header({'value': v}))
+        if np.isnan(v):
+            assert(np.isnan(z['value']))
+        else:
+            assert(z['value'] == v)
+    assert(encoder.decode_json(encoder.encode_json_header({'value': None}))
+           == {'value': None})
+    assert_raises(TypeError, encoder.encode_json_header, {'a': TestClass()})
+
+
 def test_encode_yaml():
     r"""Test encode_yaml with dict representer and file."""
     x = OrderedDict([('a', 1), ('b', 2)])
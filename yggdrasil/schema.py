@@ -934,7 +934,7 @@ class SchemaRegistry(object):
         prop_remove = {
             'comm': ['is_default', 'length_map', 'serializer'],
             'file': ['is_default', 'length_map',
-                     'wait_for_creation', 'working_dir',
+                     'wait_for_creation', 'flush_every', 'working_dir',
                      'read_meth', 'in_temp',
                      'serializer', 'datatype'],
             'model': ['client_of', 'is_server', 'preserve_cache',
@@ -676,18 +676,23 @@ def array_to_table(arrs, fmt_str, use_astropy=False):
         apy_ascii.write(table, fd, delimiter=delimiter,
                         format='no_header')
         out = tools.str2bytes(fd.getvalue())
+        fd.close()
     else:
-        fd = sio.BytesIO()
         fmt_str = tools.str2bytes(fmt_str)
-        for ele in arr1:
-            line = format_message(ele.tolist(), fmt_str)
-            fd.write(line)
+        # Split complex fields into real & imaginary components once for
+        # all rows rather than calling format_message for each row
+        cols = []
+        for n in arr1.dtype.names:
+            icol = arr1[n]
+            if np.iscomplexobj(icol):
+                cols += [icol.real.tolist(), icol.imag.tolist()]
+            else:
+                cols.append(icol.tolist())
+        out = b''.join([fmt_str % row for row in zip(*cols)])
         # fmt = fmt_str.split(info['newline'])[0]
         # np.savetxt(fd, arr1,
         #            fmt=fmt, delimiter=info['delimiter'],
         #            newline=info['newline'], header='')
-        out = fd.getvalue()
-    fd.close()
     return out
 
 
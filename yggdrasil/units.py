@@ -6,6 +6,14 @@ from yggdrasil import tools
 _unit_quantity = unyt.array.unyt_quantity
 _unit_array = unyt.array.unyt_array
 _ureg_unyt = None
+_mu_strs = [tools.bytes2str(b'\xc2\xb5'), tools.bytes2str(b'\xce\xbcs')]
+_degree_str = tools.bytes2str(b'\xc2\xb0')
+_matlab_unit_regex = r'(?P<name>[A-Za-z%s]+)' % ''.join(_mu_strs)
+_unit_regex = (r'(?P<paren>\()?(?P<name>[A-Za-z%s]+)'
+               r'(?:(?:(?:\^)|(?:\*\*))?(?P<exp_paren>\()?(?P<exp>-?[0-9]+)'
+               r'(?(exp_paren)\)))?'
+               r'(?(paren)\)|)(?P<op> |(?:\*)|(?:\/))?'
+               % ''.join(_mu_strs + [_degree_str, r'(?:100\%)']))
 
 
 def get_ureg():
@@ -47,8 +55,8 @@ def convert_to_pandas_timedelta(x):
     t_data = get_data(x)
     t_unit = get_units(x)
     unit_map = {'ns': 'ns',
-                (tools.bytes2str(b'\xc2\xb5') + 's'): 'us',
-                (tools.bytes2str(b'\xce\xbcs') + 's'): 'us',
+                (_mu_strs[0] + 's'): 'us',
+                (_mu_strs[1] + 's'): 'us',
                 'ms': 'ms',
                 's': 's',
                 'min': 'm',
@@ -84,9 +92,7 @@ def convert_matlab_unit_string(m_str):  # pragma: matlab
     """
     out = m_str
     replacements = {'h': 'hr'}
-    regex_mu = [tools.bytes2str(b'\xc2\xb5'),
-                tools.bytes2str(b'\xce\xbcs')]
-    regex = r'(?P<name>[A-Za-z%s]+)' % ''.join(regex_mu)
+    regex = _matlab_unit_regex
     for x in re.finditer(regex, m_str):
         xdict = x.groupdict()
         if xdict['name'] in replacements:
@@ -130,14 +136,7 @@ def convert_unit_string(orig_str, replacements=None):
                         'hrs': 'hr',
                         'days': 'day',
                         '100%': 'percent'}
-    regex_mu = [tools.bytes2str(b'\xc2\xb5'),
-                tools.bytes2str(b'\xce\xbcs'),
-                tools.bytes2str(b'\xc2\xb0'),
-                r'(?:100\%)']
-    regex = (r'(?P<paren>\()?(?P<name>[A-Za-z%s]+)'
-             r'(?:(?:(?:\^)|(?:\*\*))?(?P<exp_paren>\()?(?P<exp>-?[0-9]+)'
-             r'(?(exp_paren)\)))?'
-             r'(?(paren)\)|)(?P<op> |(?:\*)|(?:\/))?' % ''.join(regex_mu))
+    regex = _unit_regex
     out = ''
     if re.fullmatch(r'(?:%s)+' % regex, orig_str.strip()):
         for x in re.finditer(regex, orig_str.strip()):